@@ -2,13 +2,35 @@
 
 import secrets
 import json
+from typing import Any, Dict, List, Optional, TypedDict
 from flask import Blueprint, jsonify, session, request, redirect, Response, stream_with_context
 from backend.auth import get_auth_url, exchange_code_for_token, refresh_access_token
+from backend.services.playlist_compilator import (
+    OWNERSHIP_FILTERS,
+    TRACK_HEADERS,
+    filter_playlists,
+    liked_playlist_row,
+    paginate,
+    playlist_row,
+    safe_get_nested,
+    select_columns,
+    track_artists_str,
+)
 from spotipy import Spotify
 
 api = Blueprint("api", __name__, url_prefix="/api")
 
 
+class ExportSelection(TypedDict):
+    """Validated query parameters of ``/api/export/progress``."""
+    
+    playlist_ids: List[str]
+    ownership: str
+    name_pattern: Optional[str]
+    include_liked: bool
+    columns: List[str]
+
+
 @api.route("/auth/login", methods=["GET"])
 def auth_login():
     """Initiate Spotify OAuth2 login flow."""
@@ -65,20 +87,89 @@ def auth_status():
     return jsonify({"authenticated": is_authenticated}), 200
 
 
+def parse_list_arg(name: str) -> List[str]:
+    """Read a comma-separated query parameter as a list of non-empty values."""
+    raw = request.args.get(name, "")
+    return [value.strip() for value in raw.split(",") if value.strip()]
+
+
+def parse_export_selection() -> ExportSelection:
+    """Read and validate the export selection from the query string.
+    
+    Raises:
+        ValueError: If a parameter has an unsupported value
+    """
+    ownership = request.args.get("ownership", "all").lower()
+    if ownership not in OWNERSHIP_FILTERS:
+        raise ValueError(f"Invalid ownership '{ownership}', expected one of {list(OWNERSHIP_FILTERS)}")
+    
+    include_liked = request.args.get("include_liked", "true").lower()
+    if include_liked not in ("true", "false"):
+        raise ValueError("Invalid include_liked, expected 'true' or 'false'")
+    
+    columns = list(dict.fromkeys(parse_list_arg("columns")))
+    unknown = [c for c in columns if c not in TRACK_HEADERS]
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+    
+    return ExportSelection(
+        playlist_ids=parse_list_arg("playlist_ids"),
+        ownership=ownership,
+        name_pattern=request.args.get("name_pattern") or None,
+        include_liked=include_liked == "true",
+        columns=columns,
+    )
+
+
+@api.route("/playlists", methods=["GET"])
+def list_playlists():
+    """List the user's playlists with their track counts, without fetching tracks.
+    
+    The liked songs are listed last as a synthetic playlist, so its id can be
+    passed to ``/api/export/progress`` like any other playlist id.
+    """
+    access_token = session.get("access_token")
+    
+    if not access_token:
+        return jsonify({"error": "Not authenticated"}), 401
+    
+    try:
+        sp = Spotify(auth=access_token)
+        username = sp.current_user()["id"]
+        playlists = [playlist_row(pl) for pl in paginate(sp.current_user_playlists)]
+        liked_total = (sp.current_user_saved_tracks(limit=1) or {}).get("total", 0)
+        playlists.append(liked_playlist_row(username, liked_total))
+        
+        return jsonify({"playlists": playlists, "liked_tracks_total": liked_total}), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @api.route("/export/progress", methods=["GET"])
 def export_with_progress():
-    """Stream export progress to client using Server-Sent Events."""
+    """Stream export progress to client using Server-Sent Events.
+    
+    Optional query parameters narrow the export before any track is fetched:
+    ``playlist_ids`` (comma-separated), ``ownership`` (all/owned/followed),
+    ``name_pattern`` (case-insensitive glob), ``include_liked`` (true/false)
+    and ``columns`` (comma-separated subset of the tracks CSV headers, duplicates
+    ignored). The liked songs playlist goes through the same id, ownership and
+    name filters as the real playlists, and is only paged when it is selected
+    and ``include_liked`` is true (the default).
+    """
     access_token = session.get("access_token")
     
     if not access_token:
         return jsonify({"error": "Not authenticated"}), 401
     
+    try:
+        selection = parse_export_selection()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    
     def generate_progress():
         """Generator function that yields progress updates."""
         try:
-            from backend.services.playlist_compilator import paginate, safe_get_nested, track_artists_str
-            from typing import List, Dict, Any, Optional
-            
             # Create Spotify client
             sp = Spotify(auth=access_token)
             
@@ -99,63 +190,45 @@ def export_with_progress():
             playlists_list = list(paginate(sp.current_user_playlists))
             
             for i, pl in enumerate(playlists_list):
-                playlists_rows.append({
-                    "playlist_id": pl["id"],
-                    "name": pl["name"],
-                    "public": pl.get("public"),
-                    "collaborative": pl.get("collaborative"),
-                    "owner_id": safe_get_nested(pl, "owner", "id"),
-                    "owner_name": safe_get_nested(pl, "owner", "display_name"),
-                    "tracks_total": (pl.get("tracks") or {}).get("total"),
-                    "href": pl.get("href"),
-                    "external_url": safe_get_nested(pl, "external_urls", "spotify"),
-                    "snapshot_id": pl.get("snapshot_id"),
-                })
+                playlists_rows.append(playlist_row(pl))
                 progress = 15 + int((i / max(1, len(playlists_list))) * 15)
                 yield f"data: {json.dumps({'status': f'Descargando playlist {i+1}/{len(playlists_list)}...', 'progress': progress})}\n\n"
             
-            # Fetch liked tracks
-            yield f"data: {json.dumps({'status': 'Descargando canciones que te gustan...', 'progress': 35})}\n\n"
-            liked_items = list(paginate(lambda **kw: sp.current_user_saved_tracks(**kw)))
-            liked_items = [it for it in liked_items if (it.get("track") or {}).get("type") == "track"]
+            # The liked songs row is filtered like any other playlist, before paging
+            liked_row: Optional[Dict[str, Any]] = None
+            if selection["include_liked"]:
+                liked_row = liked_playlist_row(username, 0)
+                playlists_rows.append(liked_row)
             
-            liked_pid = f"liked_{username}"
-            liked_pname = "Canciones que te gustan"
-            liked_owner = username
-            liked_total = len(liked_items)
+            # Apply the selection before any playlist_items pagination runs
+            playlists_rows = filter_playlists(
+                playlists_rows,
+                username,
+                playlist_ids=selection["playlist_ids"],
+                ownership=selection["ownership"],
+                name_pattern=selection["name_pattern"],
+            )
+            if liked_row is not None and liked_row not in playlists_rows:
+                liked_row = None
             
-            playlists_rows.append({
-                "playlist_id": liked_pid,
-                "name": liked_pname,
-                "public": False,
-                "collaborative": False,
-                "owner_id": liked_owner,
-                "owner_name": liked_owner,
-                "tracks_total": liked_total,
-                "href": None,
-                "external_url": None,
-                "snapshot_id": None,
-            })
+            liked_items: List[Dict[str, Any]] = []
             
-            # Prepare track headers and data
-            track_headers = [
-                "playlist_id","playlist_name","playlist_owner_id",
-                "added_at","added_by_id",
-                "track_id","track_isrc","track_uri","track_url",
-                "track_name","track_popularity","artists",
-                "album_name","album_upc","album_release_date","duration_ms",
-                "explicit","is_local"
-            ]
+            # Fetch liked tracks
+            if liked_row:
+                yield f"data: {json.dumps({'status': 'Descargando canciones que te gustan...', 'progress': 35})}\n\n"
+                liked_items = list(paginate(lambda **kw: sp.current_user_saved_tracks(**kw)))
+                liked_items = [it for it in liked_items if (it.get("track") or {}).get("type") == "track"]
+                liked_row["tracks_total"] = len(liked_items)
             
-            tracks_data: List[List[str]] = [track_headers]
+            tracks_data: List[List[str]] = [list(TRACK_HEADERS)]
             yield f"data: {json.dumps({'status': 'Descargando canciones por playlist...', 'progress': 50})}\n\n"
             
             # Process real playlists
-            total_playlists = len([p for p in playlists_rows if p["playlist_id"] != liked_pid])
+            total_playlists = len([p for p in playlists_rows if p is not liked_row])
             processed = 0
             
             for pl in playlists_rows:
-                if pl["playlist_id"] == liked_pid:
+                if pl is liked_row:
                     continue
                     
                 pid = pl["playlist_id"]
@@ -198,31 +271,34 @@ def export_with_progress():
                 yield f"data: {json.dumps({'status': f'Procesando: {pname} ({processed}/{total_playlists})', 'progress': progress})}\n\n"
             
             # Process liked tracks
-            yield f"data: {json.dumps({'status': 'Agregando canciones que te gustan...', 'progress': 85})}\n\n"
-            for item in liked_items:
-                added_at = item.get("added_at")
-                t: Optional[Dict[str, Any]] = item.get("track")
-                if not t:  # type: ignore
-                    continue
-                
-                row = [
-                    liked_pid, liked_pname, liked_owner,
-                    added_at, None or "",
-                    t.get("id") or "",  # type: ignore
-                    safe_get_nested(t, "external_ids", "isrc") or "",  # type: ignore
-                    t.get("uri") or "",  # type: ignore
-                    safe_get_nested(t, "external_urls", "spotify") or "",  # type: ignore
-                    t.get("name") or "",  # type: ignore
-                    str(t.get("popularity") or ""),  # type: ignore
-                    track_artists_str(t),  # type: ignore
-                    safe_get_nested(t, "album", "name") or "",  # type: ignore
-                    safe_get_nested(t, "album", "external_ids", "upc") or "",  # type: ignore
-                    safe_get_nested(t, "album", "release_date") or "",  # type: ignore
-                    str(t.get("duration_ms") or ""),  # type: ignore
-                    str(t.get("explicit") or ""),  # type: ignore
-                    str(False)
-                ]
-                tracks_data.append(row)
+            if liked_row:
+                yield f"data: {json.dumps({'status': 'Agregando canciones que te gustan...', 'progress': 85})}\n\n"
+                for item in liked_items:
+                    added_at = item.get("added_at")
+                    t: Optional[Dict[str, Any]] = item.get("track")
+                    if not t:  # type: ignore
+                        continue
+                    
+                    row = [
+                        liked_row["playlist_id"], liked_row["name"], liked_row["owner_id"],
+                        added_at, None or "",
+                        t.get("id") or "",  # type: ignore
+                        safe_get_nested(t, "external_ids", "isrc") or "",  # type: ignore
+                        t.get("uri") or "",  # type: ignore
+                        safe_get_nested(t, "external_urls", "spotify") or "",  # type: ignore
+                        t.get("name") or "",  # type: ignore
+                        str(t.get("popularity") or ""),  # type: ignore
+                        track_artists_str(t),  # type: ignore
+                        safe_get_nested(t, "album", "name") or "",  # type: ignore
+                        safe_get_nested(t, "album", "external_ids", "upc") or "",  # type: ignore
+                        safe_get_nested(t, "album", "release_date") or "",  # type: ignore
+                        str(t.get("duration_ms") or ""),  # type: ignore
+                        str(t.get("explicit") or ""),  # type: ignore
+                        str(False)
+                    ]
+                    tracks_data.append(row)
+            
+            tracks_data = select_columns(tracks_data, selection["columns"])
             
             # Finalize
             yield f"data: {json.dumps({'status': 'Finalizando...', 'progress': 95})}\n\n"
@@ -1,13 +1,25 @@
 """Services module for business logic."""
 
 from backend.services.playlist_compilator import (
+    OWNERSHIP_FILTERS,
+    TRACK_HEADERS,
+    filter_playlists,
+    liked_playlist_row,
     paginate,
+    playlist_row,
     safe_get_nested,
+    select_columns,
     track_artists_str,
 )
 
 __all__ = [
+    "OWNERSHIP_FILTERS",
+    "TRACK_HEADERS",
+    "filter_playlists",
+    "liked_playlist_row",
     "paginate",
+    "playlist_row",
     "safe_get_nested",
+    "select_columns",
     "track_artists_str",
 ]
@@ -1,10 +1,24 @@
 """Spotify playlist compilator module."""
 
 import time
+from fnmatch import fnmatch
 from typing import Iterator, Dict, Any, Optional, List
 from spotipy import Spotify
 from spotipy.exceptions import SpotifyException
 
+TRACK_HEADERS = [
+    "playlist_id","playlist_name","playlist_owner_id",
+    "added_at","added_by_id",
+    "track_id","track_isrc","track_uri","track_url",
+    "track_name","track_popularity","artists",
+    "album_name","album_upc","album_release_date","duration_ms",
+    "explicit","is_local"
+]
+
+OWNERSHIP_FILTERS = ("all", "owned", "followed")
+
+LIKED_PLAYLIST_NAME = "Canciones que te gustan"
+
 
 def safe_get_nested(data: dict, *keys: str) -> str | None:
     """Safely retrieve a string value from nested dictionaries."""
@@ -48,6 +62,81 @@ def track_artists_str(track: Dict[str, Any]) -> str:
     return ", ".join(a["name"] for a in (track.get("artists") or []))
 
 
+def playlist_row(pl: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a playlist summary row from a Spotify playlist object."""
+    return {
+        "playlist_id": pl["id"],
+        "name": pl["name"],
+        "public": pl.get("public"),
+        "collaborative": pl.get("collaborative"),
+        "owner_id": safe_get_nested(pl, "owner", "id"),
+        "owner_name": safe_get_nested(pl, "owner", "display_name"),
+        "tracks_total": (pl.get("tracks") or {}).get("total"),
+        "href": pl.get("href"),
+        "external_url": safe_get_nested(pl, "external_urls", "spotify"),
+        "snapshot_id": pl.get("snapshot_id"),
+    }
+
+
+def liked_playlist_row(username: str, total: int) -> Dict[str, Any]:
+    """Build the synthetic playlist row that holds the user's liked songs."""
+    return {
+        "playlist_id": f"liked_{username}",
+        "name": LIKED_PLAYLIST_NAME,
+        "public": False,
+        "collaborative": False,
+        "owner_id": username,
+        "owner_name": username,
+        "tracks_total": total,
+        "href": None,
+        "external_url": None,
+        "snapshot_id": None,
+    }
+
+
+def filter_playlists(
+    playlists_rows: List[Dict[str, Any]],
+    username: str,
+    playlist_ids: Optional[List[str]] = None,
+    ownership: str = "all",
+    name_pattern: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Keep only the playlists matching the export selection.
+
+    Args:
+        playlists_rows: Rows built with ``playlist_row``
+        username: Spotify id of the current user
+        playlist_ids: Playlist ids to keep (all when empty)
+        ownership: "all", "owned" (by the user) or "followed" (owned by others)
+        name_pattern: Case-insensitive glob matched against the playlist name
+
+    Returns:
+        Filtered list of playlist rows, in the original order
+    """
+    selected = []
+    wanted_ids = set(playlist_ids or [])
+    for pl in playlists_rows:
+        if wanted_ids and pl["playlist_id"] not in wanted_ids:
+            continue
+        is_owned = pl["owner_id"] == username
+        if ownership == "owned" and not is_owned:
+            continue
+        if ownership == "followed" and is_owned:
+            continue
+        if name_pattern and not fnmatch((pl["name"] or "").lower(), name_pattern.lower()):
+            continue
+        selected.append(pl)
+    return selected
+
+
+def select_columns(tracks_data: List[List[str]], columns: Optional[List[str]]) -> List[List[str]]:
+    """Project track rows (header row first) onto a subset of ``TRACK_HEADERS``."""
+    if not columns:
+        return tracks_data
+    indexes = [TRACK_HEADERS.index(c) for c in columns]
+    return [[row[i] for i in indexes] for row in tracks_data]
+
+
 def get_spotify_client() -> tuple[Spotify, str]:
     """Autentica usando access token en memoria (sin guardar archivos de caché)."""
     raise NotImplementedError("Use export_data(access_token) instead")
@@ -77,53 +166,21 @@ def export_data(access_token: str) -> tuple[List[Dict[str, Any]], List[List[str]
     playlists_rows: List[Dict[str, Any]] = []
     print("📥 Descargando playlists…")
     for pl in paginate(sp.current_user_playlists):
-        playlists_rows.append({
-            "playlist_id": pl["id"],
-            "name": pl["name"],
-            "public": pl.get("public"),
-            "collaborative": pl.get("collaborative"),
-            "owner_id": safe_get_nested(pl, "owner", "id"),
-            "owner_name": safe_get_nested(pl, "owner", "display_name"),
-            "tracks_total": (pl.get("tracks") or {}).get("total"),
-            "href": pl.get("href"),
-            "external_url": safe_get_nested(pl, "external_urls", "spotify"),
-            "snapshot_id": pl.get("snapshot_id"),
-        })
+        playlists_rows.append(playlist_row(pl))
 
     # --- 2) Recoger "Canciones que te gustan" (Saved Tracks)
     print("📥 Descargando 'Canciones que te gustan'…")
     liked_items = list(paginate(lambda **kw: sp.current_user_saved_tracks(**kw)))
     liked_items = [it for it in liked_items if (it.get("track") or {}).get("type") == "track"]
 
-    liked_pid = f"liked_{username}"
-    liked_pname = "Canciones que te gustan"
-    liked_owner = username
-    liked_total = len(liked_items)
-
-    playlists_rows.append({
-        "playlist_id": liked_pid,
-        "name": liked_pname,
-        "public": False,
-        "collaborative": False,
-        "owner_id": liked_owner,
-        "owner_name": liked_owner,
-        "tracks_total": liked_total,
-        "href": None,
-        "external_url": None,
-        "snapshot_id": None,
-    })
+    liked_row = liked_playlist_row(username, len(liked_items))
+    liked_pid = liked_row["playlist_id"]
+    liked_pname = liked_row["name"]
+    liked_owner = liked_row["owner_id"]
+    playlists_rows.append(liked_row)
 
     # --- 3) Preparar encabezados y datos de tracks
-    track_headers = [
-        "playlist_id","playlist_name","playlist_owner_id",
-        "added_at","added_by_id",
-        "track_id","track_isrc","track_uri","track_url",
-        "track_name","track_popularity","artists",
-        "album_name","album_upc","album_release_date","duration_ms",
-        "explicit","is_local"
-    ]
-    
-    tracks_data: List[List[str]] = [track_headers]
+    tracks_data: List[List[str]] = [list(TRACK_HEADERS)]
     print("📥 Descargando canciones por playlist…")
     
     # 3a) Playlists reales
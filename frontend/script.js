@@ -7,6 +7,9 @@ const downloadSection = document.getElementById('downloadSection');
 const progressContainer = document.getElementById('progressContainer');
 const progressBar = document.getElementById('progressBar');
 const progressStatus = document.getElementById('progressStatus');
+const playlistSelection = document.getElementById('playlistSelection');
+const playlistList = document.getElementById('playlistList');
+const selectAll = document.getElementById('selectAll');
 
 // Variable para controlar la animación de progreso
 let currentProgress = 0;
@@ -73,6 +76,72 @@ function downloadFile(content, filename, mimeType = 'text/csv') {
     document.body.removeChild(a);
 }
 
+/**
+ * Load the user's playlists (without their tracks) into the selection list.
+ */
+async function loadPlaylists() {
+    playlistList.innerHTML = '';
+    selectAll.checked = true;
+
+    try {
+        const response = await fetch('/api/playlists');
+        const data = await response.json();
+
+        if (!response.ok) {
+            throw new Error(data.error || response.statusText);
+        }
+
+        for (const playlist of data.playlists) {
+            const label = document.createElement('label');
+            label.className = 'playlist-item';
+
+            const checkbox = document.createElement('input');
+            checkbox.type = 'checkbox';
+            checkbox.value = playlist.playlist_id;
+            checkbox.checked = true;
+            checkbox.addEventListener('change', updateSelectAll);
+
+            const text = document.createElement('span');
+            text.textContent = `${playlist.name} (${playlist.tracks_total ?? 0})`;
+
+            label.append(checkbox, text);
+            playlistList.appendChild(label);
+        }
+
+        playlistSelection.style.display = 'block';
+    } catch (error) {
+        // Without the list the full library is still exported
+        console.error('Error loading playlists:', error);
+        playlistSelection.style.display = 'none';
+    }
+}
+
+/**
+ * Keep the "All playlists" checkbox in sync with the individual ones.
+ */
+function updateSelectAll() {
+    const checkboxes = [...playlistList.querySelectorAll('input[type="checkbox"]')];
+    selectAll.checked = checkboxes.every(checkbox => checkbox.checked);
+}
+
+/**
+ * Build the export URL for the selected playlists.
+ * @returns {string|null} Export URL, or null when nothing is selected
+ */
+function buildExportUrl() {
+    const checkboxes = [...playlistList.querySelectorAll('input[type="checkbox"]')];
+    const selectedIds = checkboxes.filter(checkbox => checkbox.checked).map(checkbox => checkbox.value);
+
+    // Full export when everything (or no list at all) is selected
+    if (selectedIds.length === checkboxes.length) {
+        return '/api/export/progress';
+    }
+    if (selectedIds.length === 0) {
+        return null;
+    }
+    return `/api/export/progress?playlist_ids=${encodeURIComponent(selectedIds.join(','))}`;
+}
+
 /**
  * Download data with progress tracking using Server-Sent Events.
  */
@@ -82,6 +151,13 @@ async function downloadWithProgress() {
         return;
     }
 
+    const exportUrl = buildExportUrl();
+    if (!exportUrl) {
+        statusDiv.textContent = '❌ Selecciona al menos una playlist';
+        statusDiv.className = 'status error';
+        return;
+    }
+
     progressContainer.style.display = 'block';
     downloadBtn.disabled = true;
     logoutBtn.disabled = true;
@@ -92,7 +168,7 @@ async function downloadWithProgress() {
     progressBar.style.width = '0%';
 
     try {
-        const eventSource = new EventSource('/api/export/progress');
+        const eventSource = new EventSource(exportUrl);
 
         eventSource.onmessage = (event) => {
             const data = JSON.parse(event.data);
@@ -186,6 +262,7 @@ async function checkAuthStatus() {
         if (data.authenticated) {
             loginSection.style.display = 'none';
             downloadSection.style.display = 'block';
+            await loadPlaylists();
         } else {
             loginSection.style.display = 'block';
             downloadSection.style.display = 'none';
@@ -228,6 +305,13 @@ logoutBtn.addEventListener('click', async () => {
     }
 });
 
+// Select or clear every playlist at once
+selectAll.addEventListener('change', () => {
+    playlistList.querySelectorAll('input[type="checkbox"]').forEach(checkbox => {
+        checkbox.checked = selectAll.checked;
+    });
+});
+
 // Download button handler with progress tracking
 downloadBtn.addEventListener('click', downloadWithProgress);
 
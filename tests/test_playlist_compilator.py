@@ -0,0 +1,74 @@
+"""Tests for the playlist selection helpers."""
+
+from backend.services.playlist_compilator import (
+    TRACK_HEADERS,
+    filter_playlists,
+    liked_playlist_row,
+    select_columns,
+)
+
+ROWS = [
+    {"playlist_id": "a", "name": "Rock Classics", "owner_id": "me"},
+    {"playlist_id": "b", "name": "Jazz", "owner_id": "other"},
+    {"playlist_id": "c", "name": None, "owner_id": "me"},
+]
+
+
+def ids(rows: list) -> list[str]:
+    """Return the playlist ids of the given rows."""
+    return [row["playlist_id"] for row in rows]
+
+
+def test_filter_playlists_without_filters_keeps_all() -> None:
+    assert ids(filter_playlists(ROWS, "me")) == ["a", "b", "c"]
+
+
+def test_filter_playlists_by_id() -> None:
+    assert ids(filter_playlists(ROWS, "me", playlist_ids=["c", "a"])) == ["a", "c"]
+
+
+def test_filter_playlists_by_unknown_id_returns_nothing() -> None:
+    assert filter_playlists(ROWS, "me", playlist_ids=["missing"]) == []
+
+
+def test_filter_playlists_owned() -> None:
+    assert ids(filter_playlists(ROWS, "me", ownership="owned")) == ["a", "c"]
+
+
+def test_filter_playlists_followed() -> None:
+    assert ids(filter_playlists(ROWS, "me", ownership="followed")) == ["b"]
+
+
+def test_filter_playlists_name_pattern_is_case_insensitive_glob() -> None:
+    assert ids(filter_playlists(ROWS, "me", name_pattern="*ROCK*")) == ["a"]
+    assert filter_playlists(ROWS, "me", name_pattern="rock") == []
+
+
+def test_filter_playlists_name_pattern_with_none_name() -> None:
+    assert ids(filter_playlists(ROWS, "me", name_pattern="*")) == ["a", "b", "c"]
+    assert ids(filter_playlists(ROWS, "me", name_pattern="?*")) == ["a", "b"]
+
+
+def test_select_columns_empty_keeps_all_columns() -> None:
+    tracks = [list(TRACK_HEADERS), [str(i) for i in range(len(TRACK_HEADERS))]]
+    assert select_columns(tracks, []) == tracks
+
+
+def test_select_columns_projects_header_and_rows() -> None:
+    tracks = [list(TRACK_HEADERS), [str(i) for i in range(len(TRACK_HEADERS))]]
+    name_index = TRACK_HEADERS.index("track_name")
+    artists_index = TRACK_HEADERS.index("artists")
+
+    result = select_columns(tracks, ["artists", "track_name"])
+
+    assert result == [
+        ["artists", "track_name"],
+        [str(artists_index), str(name_index)],
+    ]
+
+
+def test_liked_playlist_row() -> None:
+    row = liked_playlist_row("me", 3)
+    assert row["playlist_id"] == "liked_me"
+    assert row["owner_id"] == "me"
+    assert row["tracks_total"] == 3
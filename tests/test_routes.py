@@ -0,0 +1,140 @@
+"""Tests for the export API routes."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+import backend.routes
+from backend.app import create_app
+
+
+@pytest.fixture
+def client():
+    """Flask test client with an authenticated session."""
+    app = create_app()
+    app.config["TESTING"] = True
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess["access_token"] = "token"
+    return client
+
+
+@pytest.fixture
+def spotify(monkeypatch) -> MagicMock:
+    """Mocked Spotify client returned by every ``Spotify(...)`` call in routes."""
+    sp = MagicMock()
+    sp.current_user.return_value = {"id": "me", "display_name": "Me"}
+    sp.current_user_playlists.return_value = {
+        "items": [
+            {"id": "a", "name": "Rock", "owner": {"id": "me"}, "tracks": {"total": 1}},
+            {"id": "b", "name": "Jazz", "owner": {"id": "other"}, "tracks": {"total": 1}},
+        ],
+        "next": None,
+    }
+    sp.current_user_saved_tracks.return_value = {"items": [], "next": None, "total": 0}
+    sp.playlist_items.return_value = {
+        "items": [{"track": {"type": "track", "id": "t1", "name": "Song"}}],
+        "next": None,
+    }
+    monkeypatch.setattr(backend.routes, "Spotify", MagicMock(return_value=sp))
+    return sp
+
+
+def last_event(response) -> dict:
+    """Parse the final Server-Sent Event of a streamed response."""
+    events = response.get_data(as_text=True).strip().split("\n\n")
+    return json.loads(events[-1].removeprefix("data: "))
+
+
+@pytest.mark.parametrize("query", [
+    "ownership=mine",
+    "include_liked=maybe",
+    "columns=track_name,unknown",
+])
+def test_export_rejects_invalid_selection(client, query: str) -> None:
+    response = client.get(f"/api/export/progress?{query}")
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+def test_export_fetches_only_selected_playlists(client, spotify: MagicMock) -> None:
+    response = client.get("/api/export/progress?playlist_ids=b&include_liked=false")
+
+    data = last_event(response)
+    fetched = [call.args[0] for call in spotify.playlist_items.call_args_list]
+    assert fetched == ["b"]
+    spotify.current_user_saved_tracks.assert_not_called()
+    assert [row[0] for row in data["playlists"]] == ["b"]
+
+
+def test_export_skips_liked_songs_not_in_playlist_ids(client, spotify: MagicMock) -> None:
+    response = client.get("/api/export/progress?playlist_ids=a")
+
+    data = last_event(response)
+    spotify.current_user_saved_tracks.assert_not_called()
+    assert [row[0] for row in data["playlists"]] == ["a"]
+
+
+def test_export_selects_liked_songs_by_id(client, spotify: MagicMock) -> None:
+    response = client.get("/api/export/progress?playlist_ids=a,liked_me")
+
+    data = last_event(response)
+    spotify.current_user_saved_tracks.assert_called()
+    assert [row[0] for row in data["playlists"]] == ["a", "liked_me"]
+
+
+def test_export_followed_excludes_liked_songs(client, spotify: MagicMock) -> None:
+    response = client.get("/api/export/progress?ownership=followed")
+
+    data = last_event(response)
+    fetched = [call.args[0] for call in spotify.playlist_items.call_args_list]
+    assert fetched == ["b"]
+    spotify.current_user_saved_tracks.assert_not_called()
+    assert [row[0] for row in data["playlists"]] == ["b"]
+
+
+def test_export_name_pattern_matches_liked_songs(client, spotify: MagicMock) -> None:
+    response = client.get("/api/export/progress?name_pattern=*gustan*")
+
+    data = last_event(response)
+    spotify.playlist_items.assert_not_called()
+    spotify.current_user_saved_tracks.assert_called()
+    assert [row[0] for row in data["playlists"]] == ["liked_me"]
+
+
+def test_export_include_liked_false_overrides_selection(client, spotify: MagicMock) -> None:
+    response = client.get("/api/export/progress?name_pattern=*gustan*&include_liked=false")
+
+    data = last_event(response)
+    spotify.current_user_saved_tracks.assert_not_called()
+    assert data["playlists"] == []
+
+
+def test_export_drops_duplicate_columns(client, spotify: MagicMock) -> None:
+    response = client.get("/api/export/progress?columns=track_name,track_name,playlist_id")
+
+    data = last_event(response)
+    assert data["tracks"][0] == ["track_name", "playlist_id"]
+
+
+def test_list_playlists_requires_session() -> None:
+    response = create_app().test_client().get("/api/playlists")
+    assert response.status_code == 401
+
+
+def test_list_playlists_returns_totals_without_fetching_tracks(client, spotify: MagicMock) -> None:
+    spotify.current_user_saved_tracks.return_value = {"items": [], "next": None, "total": 42}
+
+    response = client.get("/api/playlists")
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [(pl["playlist_id"], pl["tracks_total"]) for pl in data["playlists"]] == [
+        ("a", 1),
+        ("b", 1),
+        ("liked_me", 42),
+    ]
+    assert data["liked_tracks_total"] == 42
+    spotify.current_user_saved_tracks.assert_called_once_with(limit=1)
+    spotify.playlist_items.assert_not_called()